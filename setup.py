@@ -7,7 +7,11 @@ setup(
     description="UltraOCR Python SDK",
     author="Nuveo",
     install_requires=["requests"],
+    extras_require={
+        "orjson": ["orjson"],
+        "compression": ["urllib3[brotli,zstd]>=2"],
+    },
     setup_requires=["pytest-runner"],
-    tests_require=["pytest==8.3.3", "responses"],
+    tests_require=["pytest==8.3.3", "pytest-xdist", "responses"],
     test_suite="tests",
 )
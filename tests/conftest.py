@@ -0,0 +1,17 @@
+import pytest
+
+from ultraocr import Client
+
+
+@pytest.fixture(scope="session")
+def client():
+    c = Client()
+    yield c
+    c.close()
+
+
+@pytest.fixture(scope="session")
+def file_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("files") / "document.txt"
+    path.write_bytes(b"document")
+    return str(path)
@@ -0,0 +1,255 @@
+import asyncio, json, time, pytest, responses
+
+from ultraocr import (
+    AsyncClient,
+    BASE_URL,
+    AUTH_BASE_URL,
+    InvalidStatusCodeException,
+    TimeoutException,
+)
+
+TOKEN_URL = f"{AUTH_BASE_URL}/token"
+JOB_URL = f"{BASE_URL}/ocr/job/rg"
+JOB_RESULT_URL = f"{BASE_URL}/ocr/job/result/123/123"
+BATCH_JOB_RESULT_URL = f"{BASE_URL}/ocr/job/result/123/234"
+BATCH_STATUS_URL = f"{BASE_URL}/ocr/batch/status/123"
+
+
+@responses.activate
+def test_authenticate():
+    responses.add(
+        responses.POST,
+        TOKEN_URL,
+        json={"token": "abc"},
+        status=200,
+    )
+
+    c = AsyncClient()
+    asyncio.run(c.authenticate("123", "321"))
+
+    assert c.client.token == "abc"
+
+
+def test_aclose():
+    async def close():
+        async with AsyncClient() as c:
+            executor = c.client._executor
+
+        return executor
+
+    executor = asyncio.run(close())
+
+    with pytest.raises(RuntimeError):
+        executor.submit(print)
+
+
+@responses.activate
+def test_send_job(file_path):
+    responses.add(
+        responses.POST,
+        JOB_URL,
+        json={
+            "urls": {"document": "https://test2.com"},
+            "id": "123",
+            "status_url": "https://test.com",
+        },
+        status=200,
+    )
+
+    responses.add(
+        responses.PUT,
+        "https://test2.com",
+        status=200,
+    )
+
+    c = AsyncClient()
+    res = asyncio.run(c.send_job("rg", file_path))
+
+    assert res.get("id") == "123"
+    assert res.get("status_url") == "https://test.com"
+
+
+@responses.activate
+def test_send_jobs_bulk(file_path):
+    responses.add(
+        responses.POST,
+        JOB_URL,
+        json={
+            "urls": {"document": "https://test2.com"},
+            "id": "123",
+            "status_url": "https://test.com",
+        },
+        status=200,
+    )
+
+    responses.add(
+        responses.PUT,
+        "https://test2.com",
+        status=200,
+    )
+
+    c = AsyncClient()
+    res = asyncio.run(c.send_jobs_bulk("rg", [file_path] * 3))
+
+    assert [job.get("id") for job in res] == ["123"] * 3
+    assert len(responses.calls) == 6
+
+
+@responses.activate
+def test_get_job_result_unauthorized():
+    responses.add(
+        responses.GET,
+        JOB_RESULT_URL,
+        status=401,
+    )
+
+    c = AsyncClient()
+    with pytest.raises(InvalidStatusCodeException):
+        asyncio.run(c.get_job_result("123", "123"))
+
+
+@responses.activate
+def test_wait_for_batch_done_with_jobs():
+    responses.add(
+        responses.GET,
+        BATCH_STATUS_URL,
+        json={
+            "batch_ksuid": "123",
+            "jobs": [{"job_ksuid": "234"}, {"job_ksuid": "345"}],
+            "service": "rg",
+            "status": "done",
+        },
+        status=200,
+    )
+
+    for job_id in ["234", "345"]:
+        responses.add(
+            responses.GET,
+            f"{BASE_URL}/ocr/job/result/123/{job_id}",
+            json={
+                "status": "done",
+            },
+            status=200,
+        )
+
+    async def wait():
+        async with AsyncClient() as c:
+            return await c.wait_for_batch_done("123")
+
+    res = asyncio.run(wait())
+
+    assert res.get("batch_ksuid") == "123"
+    assert res.get("status") == "done"
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_wait_for_job_done_timeout():
+    responses.add(
+        responses.GET,
+        BATCH_JOB_RESULT_URL,
+        json={
+            "job_ksuid": "234",
+            "service": "rg",
+            "status": "processing",
+        },
+        status=200,
+    )
+
+    c = AsyncClient(timeout=0.2)
+    with pytest.raises(TimeoutException):
+        asyncio.run(c.wait_for_job_done("123", "234"))
+
+
+@responses.activate
+def test_wait_for_jobs_done_concurrently():
+    for job_id in ["234", "345"]:
+        url = f"{BASE_URL}/ocr/job/result/123/{job_id}"
+        responses.add(
+            responses.GET,
+            url,
+            json={"status": "processing"},
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            url,
+            json={"status": "done"},
+            status=200,
+        )
+
+    async def wait():
+        async with AsyncClient(max_concurrency=1, interval=0.1) as c:
+            return await asyncio.gather(
+                c.wait_for_job_done("123", "234"),
+                c.wait_for_job_done("123", "345"),
+            )
+
+    res = asyncio.run(wait())
+
+    assert [r.get("status") for r in res] == ["done", "done"]
+    assert len(responses.calls) == 4
+
+
+@responses.activate
+def test_wait_for_job_done_hedged():
+    calls = []
+
+    def callback(request):
+        calls.append(request)
+        if len(calls) == 1:
+            time.sleep(0.5)
+
+        return (200, {}, json.dumps({"status": "done"}))
+
+    responses.add_callback(
+        responses.GET,
+        BATCH_JOB_RESULT_URL,
+        callback=callback,
+        content_type="application/json",
+    )
+
+    async def wait():
+        async with AsyncClient(hedge_delay=0.05) as c:
+            start = time.monotonic()
+            res = await c.wait_for_job_done("123", "234")
+            return res, time.monotonic() - start
+
+    res, elapsed = asyncio.run(wait())
+
+    assert res.get("status") == "done"
+    assert len(calls) == 2
+    assert elapsed < 0.5
+
+
+@responses.activate
+def test_wait_for_job_done_hedged_holds_slot():
+    calls = []
+
+    def callback(request):
+        calls.append(request)
+        if len(calls) == 1:
+            time.sleep(0.3)
+
+        return (200, {}, json.dumps({"status": "done"}))
+
+    responses.add_callback(
+        responses.GET,
+        BATCH_JOB_RESULT_URL,
+        callback=callback,
+        content_type="application/json",
+    )
+
+    async def wait():
+        async with AsyncClient(max_concurrency=2, hedge_delay=0.05) as c:
+            await c.wait_for_job_done("123", "234")
+            running = c._semaphore._value
+
+            await asyncio.sleep(0.5)
+            return running, c._semaphore._value
+
+    running, finished = asyncio.run(wait())
+
+    # The slow request still held its slot after the fast one returned
+    assert running == 1
+    assert finished == 2
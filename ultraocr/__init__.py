@@ -1,6 +1,7 @@
 """ Main UltraOCR SDK module """
 
 from ultraocr.functions import *
+from ultraocr.aio import *
 from ultraocr.constants import *
 from ultraocr.exceptions import *
 from ultraocr.helpers import *
@@ -0,0 +1,405 @@
+""" Module providing the UltraOCR async Client """
+
+import asyncio
+
+import requests
+
+from ultraocr.functions import Client, _Pooling
+from ultraocr.exceptions import TimeoutException
+from ultraocr.constants import (
+    Resource,
+    API_TIMEOUT,
+    MAX_CONCURRENCY,
+    DEFAULT_EXPIRATION_TIME,
+    FINAL_STATUSES,
+)
+
+
+class AsyncClient:
+    """UltraOCR async Client
+
+    Async version of the Client, with the same methods as coroutines. The requests run on worker
+    threads over the Client connection pool, while the waits between poolings run on the event
+    loop, so many jobs and batches can be sent and waited concurrently in a single event loop
+    without holding a thread each. For more details about all arguments and returns, access
+    the Client documentation.
+
+    Attributes:
+        client: The Client used to make the requests.
+        max_concurrency: The maximum number of concurrent requests.
+        hedge_delay: The time to wait a pooling response before sending a second one.
+    """
+
+    def __init__(
+        self, max_concurrency: int = MAX_CONCURRENCY, hedge_delay: float = 0, **kwargs
+    ):
+        """Initializes the instance based on preferences.
+
+        Args:
+            max_concurrency: The maximum number of concurrent requests (Default 16).
+            hedge_delay: The time in seconds to wait a pooling response before sending a second one, using the first to return, while the other still completes, 0 means disabled (Default 0).
+            kwargs: The Client arguments.
+        """
+        self.client = Client(max_concurrency=max_concurrency, **kwargs)
+        self.max_concurrency = max_concurrency
+        self.hedge_delay = hedge_delay
+        self._semaphore = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    def close(self) -> None:
+        """Close the Client.
+
+        Close the Client connection pool, waiting the running requests.
+        """
+        self.client.close()
+
+    async def aclose(self) -> None:
+        """Close the Client.
+
+        Async version of `close`, waiting the running requests (including the discarded
+        hedged ones) on a worker thread, so the event loop isn't blocked.
+        """
+        await asyncio.to_thread(self.client.close)
+
+    async def warm_up(self) -> None:
+        """Warm up the Client.
+
+        Async version of `Client.warm_up`.
+        """
+        await self._run(self.client.warm_up)
+
+    def _release(self, task: asyncio.Future) -> None:
+        if not task.cancelled():
+            task.exception()
+
+        self._semaphore.release()
+
+    async def _run(self, func, *args):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        await self._semaphore.acquire()
+
+        # A cancelled call can't stop its thread, so the slot is only released when the
+        # thread finishes
+        task = asyncio.ensure_future(asyncio.to_thread(func, *args))
+        task.add_done_callback(self._release)
+
+        return await asyncio.shield(task)
+
+    async def _hedge(self, func, *args):
+        # Only for idempotent requests, the slower one is discarded but still completes,
+        # holding its max_concurrency slot until then
+        if not self.hedge_delay:
+            return await self._run(func, *args)
+
+        first = asyncio.ensure_future(self._run(func, *args))
+        done, _ = await asyncio.wait({first}, timeout=self.hedge_delay)
+        if done:
+            return first.result()
+
+        second = asyncio.ensure_future(self._run(func, *args))
+        done, pending = await asyncio.wait(
+            {first, second}, return_when=asyncio.FIRST_COMPLETED
+        )
+        for task in pending:
+            task.cancel()
+
+        return done.pop().result()
+
+    async def _wait_for_status(self, url: str):
+        client = self.client
+        res = client._cached(url)
+        if res is not None:
+            return res
+
+        pooling = _Pooling(client, url)
+        error = None
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + client.timeout
+
+        while True:
+            try:
+                resp = await self._hedge(
+                    client._get, url, None, API_TIMEOUT, pooling.headers, False
+                )
+            except (requests.exceptions.SSLError, requests.exceptions.ProxyError):
+                # Won't be solved by pooling again
+                raise
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                resp = None
+                error = exc
+
+            wait = pooling.step(resp)
+            if wait is None:
+                return pooling.res
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise TimeoutException(client.timeout, pooling.res) from error
+
+            await asyncio.sleep(min(wait, remaining))
+
+    async def authenticate(
+        self, client_id: str, client_secret: str, expires: int = DEFAULT_EXPIRATION_TIME
+    ) -> None:
+        """Authenticate on UltraOCR.
+
+        Async version of `Client.authenticate`.
+        """
+        await self._run(self.client.authenticate, client_id, client_secret, expires)
+
+    async def generate_signed_url(
+        self,
+        service: str,
+        metadata: dict = None,
+        params: dict = None,
+        resource: Resource = Resource.JOB,
+    ):
+        """Generate signed url to send the document.
+
+        Async version of `Client.generate_signed_url`.
+        """
+        return await self._run(
+            self.client.generate_signed_url, service, metadata, params, resource
+        )
+
+    async def send_job_single_step(
+        self,
+        service: str,
+        file: str,
+        facematch_file: str = "",
+        extra_file: str = "",
+        metadata: dict = None,
+        params: dict = None,
+    ):
+        """Send job in a single step on UltraOCR.
+
+        Async version of `Client.send_job_single_step`.
+        """
+        return await self._run(
+            self.client.send_job_single_step,
+            service,
+            file,
+            facematch_file,
+            extra_file,
+            metadata,
+            params,
+        )
+
+    async def send_job(
+        self,
+        service: str,
+        file_path: str,
+        facematch_file_path: str = "",
+        extra_file_path: str = "",
+        metadata: dict = None,
+        params: dict = None,
+    ):
+        """Send job.
+
+        Async version of `Client.send_job`.
+        """
+        return await self._run(
+            self.client.send_job,
+            service,
+            file_path,
+            facematch_file_path,
+            extra_file_path,
+            metadata,
+            params,
+        )
+
+    async def send_jobs_bulk(
+        self,
+        service: str,
+        file_paths: list[str],
+        metadata: dict = None,
+        params: dict = None,
+        facematch_file_paths: list[str] = None,
+        extra_file_paths: list[str] = None,
+    ) -> list[dict]:
+        """Send many jobs.
+
+        Async version of `Client.send_jobs_bulk`.
+        """
+        return await self._run(
+            self.client.send_jobs_bulk,
+            service,
+            file_paths,
+            metadata,
+            params,
+            facematch_file_paths,
+            extra_file_paths,
+        )
+
+    async def send_batch(
+        self, service: str, file_path: str, metadata: list[dict] = None, params: dict = None
+    ):
+        """Send batch.
+
+        Async version of `Client.send_batch`.
+        """
+        return await self._run(
+            self.client.send_batch, service, file_path, metadata, params
+        )
+
+    async def send_job_base64(
+        self,
+        service: str,
+        file: str,
+        facematch_file: str = "",
+        extra_file: str = "",
+        metadata: dict = None,
+        params: dict = None,
+    ):
+        """Send job on base64.
+
+        Async version of `Client.send_job_base64`.
+        """
+        return await self._run(
+            self.client.send_job_base64,
+            service,
+            file,
+            facematch_file,
+            extra_file,
+            metadata,
+            params,
+        )
+
+    async def send_batch_base64(
+        self,
+        service: str,
+        file: str,
+        metadata: list[dict] = None,
+        params: dict = None,
+    ):
+        """Send batch on base64.
+
+        Async version of `Client.send_batch_base64`.
+        """
+        return await self._run(
+            self.client.send_batch_base64, service, file, metadata, params
+        )
+
+    async def get_batch_status(self, batch_id: str):
+        """Get document batch status.
+
+        Async version of `Client.get_batch_status`.
+        """
+        return await self._run(self.client.get_batch_status, batch_id)
+
+    async def get_job_result(self, batch_id: str, job_id: str):
+        """Get job result.
+
+        Async version of `Client.get_job_result`.
+        """
+        return await self._run(self.client.get_job_result, batch_id, job_id)
+
+    async def wait_for_job_done(self, batch_id: str, job_id: str):
+        """Wait the job to be processed.
+
+        Async version of `Client.wait_for_job_done`.
+        """
+        url = f"{self.client._job_result_url}{batch_id}/{job_id}"
+
+        return await self._wait_for_status(url)
+
+    async def wait_for_batch_done(self, batch_id: str, wait_jobs: bool = True):
+        """Wait the batch to be processed.
+
+        Async version of `Client.wait_for_batch_done`, waiting all the batch jobs at once.
+        """
+        url = f"{self.client._batch_status_url}{batch_id}"
+        res = await self._wait_for_status(url)
+
+        if wait_jobs:
+            await asyncio.gather(
+                *(
+                    self.wait_for_job_done(batch_id, job["job_ksuid"])
+                    for job in res.get("jobs") or []
+                    if job.get("status") not in FINAL_STATUSES
+                )
+            )
+
+        return res
+
+    async def get_jobs(self, start: str, end: str) -> list:
+        """Get jobs.
+
+        Async version of `Client.get_jobs`.
+        """
+        return await self._run(self.client.get_jobs, start, end)
+
+    async def create_and_wait_job(
+        self,
+        service: str,
+        file_path: str,
+        facematch_file_path: str = "",
+        extra_file_path: str = "",
+        metadata: dict = None,
+        params: dict = None,
+    ):
+        """Create and wait job.
+
+        Async version of `Client.create_and_wait_job`.
+        """
+        res = await self.send_job(
+            service, file_path, facematch_file_path, extra_file_path, metadata, params
+        )
+
+        job_id = res.get("id")
+
+        # A job sent without a batch is its own batch, so the job id is repeated
+        return await self.wait_for_job_done(job_id, job_id)
+
+    async def create_and_wait_batch(
+        self,
+        service: str,
+        file_path: str,
+        metadata: list[dict] = None,
+        params: dict = None,
+        wait_jobs: bool = True,
+    ):
+        """Create and wait batch.
+
+        Async version of `Client.create_and_wait_batch`.
+        """
+        res = await self.send_batch(service, file_path, metadata, params)
+
+        batch_id = res.get("id")
+
+        return await self.wait_for_batch_done(batch_id, wait_jobs)
+
+    async def get_job_info(self, job_id: str):
+        """Get job info.
+
+        Async version of `Client.get_job_info`.
+        """
+        return await self._run(self.client.get_job_info, job_id)
+
+    async def get_batch_info(self, batch_id: str):
+        """Get document batch info.
+
+        Async version of `Client.get_batch_info`.
+        """
+        return await self._run(self.client.get_batch_info, batch_id)
+
+    async def get_batch_result(self, batch_id: str):
+        """Get batch jobs results.
+
+        Async version of `Client.get_batch_result`.
+        """
+        return await self._run(self.client.get_batch_result, batch_id)
+
+    async def get_batch_result_storage(self, batch_id: str, params: dict = None):
+        """Get batch jobs results as file.
+
+        Async version of `Client.get_batch_result_storage`.
+        """
+        return await self._run(self.client.get_batch_result_storage, batch_id, params)
@@ -1,15 +1,44 @@
 """ Module providing UltraOCR SDK constants """
 
 from enum import Enum
+from http import HTTPStatus
 
 POOLING_INTERVAL = 1
+MIN_POOLING_INTERVAL = 0.1
+MAX_POOLING_INTERVAL = 15
+POOLING_BACKOFF_FACTOR = 2.0
+POOLING_JITTER = 0.2
 API_TIMEOUT = 30
 UPLOAD_TIMEOUT = 120
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 20
+UPLOAD_POOL_MAXSIZE = 32
+MAX_CONCURRENCY = 16
+CACHE_MAXSIZE = 1024
+MAX_RETRIES = 3
+CONNECT_RETRIES = 2
+RETRY_BACKOFF = 0.5
+MAX_RETRY_BACKOFF = 8
+RETRY_JITTER = 0.1
+# Plain ints, the HTTPStatus members are slower to compare on every response
+HTTP_OK = int(HTTPStatus.OK)
+HTTP_UNAUTHORIZED = int(HTTPStatus.UNAUTHORIZED)
+HTTP_NOT_MODIFIED = int(HTTPStatus.NOT_MODIFIED)
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+# A gateway error may come after the job was created, so only rate limits are safe
+POST_RETRY_STATUS_CODES = (429,)
+GZIP_LEVEL = 1
+GZIP_MIN_SIZE = 64 * 1024
+# Leaves room for the base64 growth and metadata on the 6MB single step body limit
+SINGLE_STEP_MAX_SIZE = 4 * 1024 * 1024
+UPLOAD_STATUS_CODES = frozenset({200, 201, 204})
 DEFAULT_EXPIRATION_TIME = 60
+TOKEN_REFRESH_MARGIN = 30
 BASE_URL = "https://ultraocr.apis.nuveo.ai/v2"
 AUTH_BASE_URL = "https://auth.apis.nuveo.ai/v2"
 STATUS_DONE = "done"
 STATUS_ERROR = "error"
+FINAL_STATUSES = frozenset({STATUS_DONE, STATUS_ERROR})
 KEY_FACEMATCH = "facematch"
 KEY_EXTRA = "extra-document"
 FLAG_TRUE = "true"
@@ -17,8 +46,11 @@ RETURN_REQUEST = "request"
 RETURN_STORAGE = "storage"
 
 
-class Resource(Enum):
+class Resource(str, Enum):
     """Resource type"""
 
     JOB = "job"
     BATCH = "batch"
+
+    def __str__(self) -> str:
+        return self.value
@@ -5,13 +5,33 @@ class TimeoutException(Exception):
     """Timeout exception"""
 
     def __init__(self, timeout: int, last_res):
-        super().__init__(
-            f"timeout reached | timeout: {timeout} | last response: {last_res}"
+        super().__init__(timeout, last_res)
+        self.timeout = timeout
+        self.last_res = last_res
+
+    def __str__(self) -> str:
+        return (
+            f"timeout reached | timeout: {self.timeout} | "
+            f"last response: {self.last_res}"
         )
 
 
 class InvalidStatusCodeException(Exception):
     """Invalid status code exception"""
 
-    def __init__(self, status: int, expected: int):
-        super().__init__(f"Invalid status code | got: {status} | expect: {expected}")
+    def __init__(self, status: int, expected, body: bytes = b""):
+        super().__init__(status, expected, body)
+        self.status = status
+        self.expected = expected
+        self.body = body
+
+    def __str__(self) -> str:
+        expected = self.expected
+        if not isinstance(expected, int):
+            expected = ", ".join(map(str, sorted(expected)))
+
+        msg = f"Invalid status code | got: {self.status} | expect: {expected}"
+        if self.body:
+            msg += f" | body: {self.body.decode(errors='replace')}"
+
+        return msg
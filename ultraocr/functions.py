@@ -1,13 +1,30 @@
 """ Module providing the UltraOCR Client and functions """
 
+import os
+import copy
+import gzip
 import time
-from http import HTTPStatus
+import base64
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.utils import default_headers
+from urllib3.util.retry import Retry
 
+from ultraocr.__about__ import __version__
 from ultraocr.helpers import (
-    BearerAuth,
+    JSON_HEADERS,
+    GZIP_JSON_HEADERS,
+    TOKEN_HEADERS,
+    RateLimiter,
+    decode_json,
+    encode_json,
+    get_retry_after,
+    get_token_expiration,
     upload_file,
     upload_file_with_path,
     validate_status_code,
@@ -15,13 +32,35 @@ from ultraocr.helpers import (
 from ultraocr.exceptions import TimeoutException
 from ultraocr.constants import (
     Resource,
+    HTTP_OK,
+    HTTP_UNAUTHORIZED,
+    HTTP_NOT_MODIFIED,
     POOLING_INTERVAL,
+    MIN_POOLING_INTERVAL,
+    POOLING_JITTER,
+    MAX_POOLING_INTERVAL,
+    POOLING_BACKOFF_FACTOR,
     API_TIMEOUT,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
+    UPLOAD_POOL_MAXSIZE,
+    MAX_CONCURRENCY,
+    CACHE_MAXSIZE,
+    MAX_RETRIES,
+    CONNECT_RETRIES,
+    RETRY_BACKOFF,
+    MAX_RETRY_BACKOFF,
+    RETRY_JITTER,
+    RETRY_STATUS_CODES,
+    POST_RETRY_STATUS_CODES,
+    GZIP_LEVEL,
+    GZIP_MIN_SIZE,
+    SINGLE_STEP_MAX_SIZE,
     BASE_URL,
     AUTH_BASE_URL,
     DEFAULT_EXPIRATION_TIME,
-    STATUS_DONE,
-    STATUS_ERROR,
+    TOKEN_REFRESH_MARGIN,
+    FINAL_STATUSES,
     FLAG_TRUE,
     KEY_EXTRA,
     KEY_FACEMATCH,
@@ -30,6 +69,128 @@ from ultraocr.constants import (
 )
 
 
+def _new_adapter(pool_maxsize: int) -> HTTPAdapter:
+    # Only retry connecting, the requests were not sent yet. Status codes are retried by
+    # the Client, which knows about Retry-After
+    retries = Retry(
+        total=CONNECT_RETRIES,
+        connect=CONNECT_RETRIES,
+        read=False,
+        status=0,
+        other=0,
+        backoff_factor=RETRY_BACKOFF,
+        respect_retry_after_header=False,
+        raise_on_status=False,
+    )
+
+    return HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=pool_maxsize,
+        max_retries=retries,
+    )
+
+
+def _resize_adapter(adapter: HTTPAdapter, pool_maxsize: int) -> None:
+    # Resized in place, the sessions of each thread already have the adapter mounted
+    if adapter.poolmanager.connection_pool_kw.get("maxsize") == pool_maxsize:
+        return
+
+    adapter.poolmanager.clear()
+    adapter.init_poolmanager(POOL_CONNECTIONS, pool_maxsize, block=adapter._pool_block)
+
+
+def _new_session(adapter: HTTPAdapter, headers: dict = None) -> requests.Session:
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    if headers is not None:
+        session.headers = headers
+
+    return session
+
+
+def _file_size(file_path: str) -> int:
+    return os.path.getsize(file_path) if file_path else 0
+
+
+def _encode_file(file_path: str) -> str:
+    if not file_path:
+        return ""
+
+    with open(file_path, "rb") as file_bin:
+        return base64.b64encode(file_bin.read()).decode()
+
+
+def _is_finished(res: dict) -> bool:
+    if res.get("status") not in FINAL_STATUSES:
+        return False
+
+    # A done batch may still have jobs processing
+    if res.get("total_processed", 0) < res.get("total_jobs", 0):
+        return False
+
+    return all(job.get("status") in FINAL_STATUSES for job in res.get("jobs") or [])
+
+
+def _bulk_paths(file_paths: list[str], paths: list[str], params: dict, key: str):
+    if (params or {}).get(key) != FLAG_TRUE:
+        return [""] * len(file_paths)
+
+    if paths is None or len(paths) != len(file_paths):
+        raise ValueError(f"{key} requested without one file path for each document")
+
+    return paths
+
+
+class _Pooling:
+    # The pooling state of a wait, shared by the Client and AsyncClient loops, which only
+    # make the requests and sleep
+    def __init__(self, client, url: str):
+        self.client = client
+        self.url = url
+        self.interval = max(client.interval, MIN_POOLING_INTERVAL)
+        self.max_delay = max(self.interval, client.max_interval)
+        self.delay = self.interval
+        self.status = None
+        self.etag = None
+        self.res = None
+
+    @property
+    def headers(self) -> dict:
+        return {"If-None-Match": self.etag} if self.etag else None
+
+    def step(self, resp):
+        # Returns the time to wait before the next pooling, or None when it's finished
+        delay = self.delay
+        self.delay = min(delay * self.client.backoff_factor, self.max_delay)
+
+        if resp is None or resp.status_code in RETRY_STATUS_CODES:
+            # Transient failure, back off and pool again until the timeout
+            return delay if resp is None else get_retry_after(resp, delay)
+
+        # Not modified since the last pooling, so the body was not sent again
+        if resp.status_code != HTTP_NOT_MODIFIED or self.res is None:
+            validate_status_code(resp.status_code, HTTP_OK, resp.content)
+            self.res = decode_json(resp.content)
+            self.etag = resp.headers.get("ETag")
+
+        status = self.res["status"]
+
+        if status in FINAL_STATUSES:
+            self.client._cache_result(self.url, self.res)
+            return None
+
+        # Restart the backoff when the status changes, it may be done soon
+        if status != self.status:
+            self.status = status
+            delay = self.interval
+            self.delay = min(delay * self.client.backoff_factor, self.max_delay)
+
+        # Spread the waits around the delay, so many waiters don't pool together
+        return delay * random.uniform(1 - POOLING_JITTER, 1 + POOLING_JITTER)
+
+
 class Client:
     """UltraOCR Client
 
@@ -40,14 +201,28 @@ class Client:
         client_id: The Client ID to generate token (only if auto_refresh=True).
         client_secret: The Client Secret to generate token (only if auto_refresh=True).
         token_expires: The token expiration time (only if auto_refresh=True).
-        auto_refresh: Indicates that the token will be auto generated (with client_id, client_secret and token_expires parameters).
+        auto_refresh: Indicates that the token will be auto generated (with client_id, client_secret and token_expires parameters), also when a request is unauthorized.
         auth_base_url: The base url to authenticate.
         base_url: The base url to send documents.
         timeout: The pooling timeout.
-        interval: The pooling interval.
+        interval: The initial pooling interval.
+        max_interval: The maximum pooling interval.
+        backoff_factor: The factor applied to the pooling interval after each pooling.
+        max_concurrency: The maximum number of concurrent requests when uploading files or waiting many jobs, also the minimum connection pool size, applied to the next requests when changed.
+        rps: The maximum number of requests per second (0 means unlimited).
+        max_retries: The maximum number of retries on rate limit and unavailable responses.
+        backoff_cap: The maximum time between retries.
+        compress: Indicates that the large request bodies will be sent compressed with gzip.
+        single_step: Indicates that send_job will send small files in a single step.
+        cache_ttl: The time to keep the finished jobs and batches responses (0 means disabled).
         expires_at: The authentication token expires datetime.
         token: The authentication token.
 
+    The Client keeps connection pools alive between requests, one for the API and another for
+    the uploads to signed urls (which never receives the authentication token), so it can be
+    used as a context manager (or closed with `close`) to release the connections when it's no
+    longer needed. Each thread gets its own session over the shared pools, so the Client can be
+    used from many threads at once.
     """
 
     def __init__(
@@ -58,8 +233,17 @@ class Client:
         auto_refresh: bool = False,
         auth_base_url: str = AUTH_BASE_URL,
         base_url: str = BASE_URL,
-        timeout: int = API_TIMEOUT,
-        interval: int = POOLING_INTERVAL,
+        timeout: float = API_TIMEOUT,
+        interval: float = POOLING_INTERVAL,
+        max_interval: float = MAX_POOLING_INTERVAL,
+        backoff_factor: float = POOLING_BACKOFF_FACTOR,
+        max_concurrency: int = MAX_CONCURRENCY,
+        rps: float = 0,
+        max_retries: int = MAX_RETRIES,
+        backoff_cap: float = MAX_RETRY_BACKOFF,
+        compress: bool = False,
+        cache_ttl: float = 0,
+        single_step: bool = False,
     ):
         """Initializes the instance based on preferences.
 
@@ -71,21 +255,168 @@ class Client:
             auth_base_url: The base url to authenticate (Default official UltraOCR URL).
             base_url: The base url to send documents (Default official UltraOCR URL).
             timeout: The pooling timeout in seconds (Default 30).
-            interval: The pooling interval in seconds (Default 1).
+            interval: The initial pooling interval in seconds, at least 0.1 (Default 1).
+            max_interval: The maximum pooling interval in seconds (Default 15).
+            backoff_factor: The factor applied to the pooling interval after each pooling (Default 2).
+            max_concurrency: The maximum number of concurrent requests when uploading files or waiting many jobs, also the minimum connection pool size (Default 16).
+            rps: The maximum number of requests per second, 0 means unlimited (Default 0).
+            max_retries: The maximum number of retries on rate limit and unavailable responses, only on rate limit for POST requests (Default 3).
+            backoff_cap: The maximum time between retries in seconds (Default 8).
+            compress: Indicates that the request bodies of at least 64KB will be sent compressed with gzip, useful for large base64 files (Default False).
+            cache_ttl: The time in seconds to keep the responses of finished jobs and batches (with all the batch jobs finished), returning copies of them without new requests, 0 means disabled (Default 0).
+            single_step: Indicates that send_job will send the files up to 4MB in a single step, skipping the signed url request (Default False).
         """
+        # Without the trailing slash, so the endpoints below don't get a double one
+        auth_base_url = auth_base_url.rstrip("/")
+        base_url = base_url.rstrip("/")
+
         self.auth_base_url = auth_base_url
         self.base_url = base_url
         self.timeout = timeout
         self.interval = interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff_cap = backoff_cap
+        self.compress = compress
+        self.cache_ttl = cache_ttl
+        self.single_step = single_step
+        self._limiter = RateLimiter(rps)
         self.client_id = client_id
         self.client_secret = client_secret
         self.auto_refresh = auto_refresh
         self.expires = token_expires
         self.expires_at = datetime.now()
+
+        self._token_url = f"{auth_base_url}/token"
+        self._ocr_url = f"{base_url}/ocr/"
+        self._job_send_url = f"{base_url}/ocr/job/send/"
+        self._job_result_url = f"{base_url}/ocr/job/result/"
+        self._batch_status_url = f"{base_url}/ocr/batch/status/"
+        self._batch_result_url = f"{base_url}/ocr/batch/result/"
+        self._job_results_url = f"{base_url}/ocr/job/results"
+        self._job_info_url = f"{base_url}/ocr/job/info/"
+        self._batch_info_url = f"{base_url}/ocr/batch/info/"
+        self._auth_lock = threading.Lock()
+        self._executor_lock = threading.Lock()
+        self.__executor = None
+        self.__workers = 0
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+
+        # Sized to max_concurrency, urllib3 discards the connections above the pool size
+        self._adapter = _new_adapter(max(POOL_MAXSIZE, max_concurrency))
+        self._upload_adapter = _new_adapter(max(UPLOAD_POOL_MAXSIZE, max_concurrency))
+        self._local = threading.local()
+        self._headers = default_headers()
+        self._headers.update(
+            {
+                "Accept": "application/json",
+                "User-Agent": f"ultraocr-sdk-python/{__version__}",
+            }
+        )
         self.token = ""
 
-    def _bearer_token(self):
-        return BearerAuth(self.token)
+    @property
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = _new_session(self._adapter, self._headers)
+            self._local.session = session
+
+        return session
+
+    @property
+    def _upload_session(self) -> requests.Session:
+        session = getattr(self._local, "upload_session", None)
+        if session is None:
+            session = _new_session(self._upload_adapter)
+            self._local.upload_session = session
+
+        return session
+
+    @property
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            # Rebuilt when max_concurrency changes, the running tasks still finish
+            if self.__executor is not None and self.__workers != self.max_concurrency:
+                self.__executor.shutdown(wait=False)
+                self.__executor = None
+
+            if self.__executor is None:
+                self.__workers = self.max_concurrency
+                _resize_adapter(self._adapter, max(POOL_MAXSIZE, self.__workers))
+                _resize_adapter(
+                    self._upload_adapter, max(UPLOAD_POOL_MAXSIZE, self.__workers)
+                )
+                self.__executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency,
+                    thread_name_prefix="ultraocr",
+                    initializer=self._init_worker,
+                )
+
+            return self.__executor
+
+    def _init_worker(self) -> None:
+        self._local.worker = True
+
+    @property
+    def expires_at(self) -> datetime:
+        """The authentication token expires datetime."""
+        return datetime.fromtimestamp(self._expires_ts)
+
+    @expires_at.setter
+    def expires_at(self, expires_at: datetime) -> None:
+        self._expires_ts = expires_at.timestamp()
+
+        # Refresh ahead of the expiration, on the monotonic clock to ignore clock changes
+        ttl = self._expires_ts - time.time()
+        self._refresh_at = time.monotonic() + ttl - TOKEN_REFRESH_MARGIN
+
+    @property
+    def token(self) -> str:
+        """The authentication token."""
+        return self._token
+
+    @token.setter
+    def token(self, token: str) -> None:
+        self._token = token
+        self._headers["Authorization"] = f"Bearer {token}"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self) -> None:
+        """Close the Client.
+
+        Close the Client connection pools and worker threads. The Client can still be used
+        after it, but new connections and threads will be opened.
+        """
+        with self._executor_lock:
+            if self.__executor is not None:
+                self.__executor.shutdown()
+                self.__executor = None
+
+        self._adapter.close()
+        self._upload_adapter.close()
+
+    def warm_up(self) -> None:
+        """Warm up the Client.
+
+        Open the connections to the authentication and documents hosts ahead of the first
+        requests, so they don't wait the DNS lookup and TLS handshake. The responses and
+        connection errors are ignored, as the first requests will open the connections anyway.
+        """
+        for url in dict.fromkeys((self.auth_base_url, self.base_url)):
+            try:
+                self._limiter.acquire()
+                self._session.head(url, timeout=API_TIMEOUT).close()
+            except requests.RequestException:
+                pass
 
     def _post(
         self,
@@ -94,12 +425,22 @@ class Client:
         params: dict = None,
         timeout: int = API_TIMEOUT,
     ):
-        self._auto_authenticate()
-
-        return requests.post(
+        # Encode the body here, so orjson is used when it's installed
+        data = headers = None
+        if json is not None:
+            data = encode_json(json)
+            headers = JSON_HEADERS
+
+            # Small bodies are sent as is, they would barely shrink
+            if self.compress and len(data) >= GZIP_MIN_SIZE:
+                data = gzip.compress(data, compresslevel=GZIP_LEVEL)
+                headers = GZIP_JSON_HEADERS
+
+        return self._api_request(
+            "POST",
             url,
-            auth=self._bearer_token(),
-            json=json,
+            data=data,
+            headers=headers,
             params=params,
             timeout=timeout,
         )
@@ -109,34 +450,163 @@ class Client:
         url: str,
         params: dict = None,
         timeout: int = API_TIMEOUT,
+        headers: dict = None,
+        retry: bool = True,
     ):
-        self._auto_authenticate()
-
-        return requests.get(
+        return self._api_request(
+            "GET",
             url,
-            auth=self._bearer_token(),
+            retry=retry,
+            headers=headers,
             params=params,
             timeout=timeout,
         )
 
+    def _api_request(self, method: str, url: str, retry: bool = True, **kwargs):
+        self._auto_authenticate()
+
+        token = self.token
+        resp = self._request(method, url, retry, **kwargs)
+
+        # The token may be revoked or expire earlier, so get a new one and retry once
+        if resp.status_code == HTTP_UNAUTHORIZED and self.auto_refresh:
+            self._refresh_token(token)
+            resp = self._request(method, url, retry, **kwargs)
+
+        return resp
+
+    def _request(self, method: str, url: str, retry: bool = True, **kwargs):
+        attempt = 0
+        max_retries = self.max_retries if retry else 0
+        retry_codes = RETRY_STATUS_CODES if method == "GET" else POST_RETRY_STATUS_CODES
+
+        while True:
+            self._limiter.acquire()
+            resp = self._session.request(method, url, **kwargs)
+
+            if resp.status_code not in retry_codes or attempt >= max_retries:
+                return resp
+
+            delay = min(self.backoff_cap, RETRY_BACKOFF * 2**attempt)
+            delay += random.uniform(0, delay * RETRY_JITTER)
+            time.sleep(min(self.backoff_cap, get_retry_after(resp, delay)))
+            attempt += 1
+
     def _auto_authenticate(self) -> None:
-        if self.auto_refresh and datetime.now() > self.expires_at:
-            self.authenticate(self.client_id, self.client_secret, self.expires)
+        if not self.auto_refresh or time.monotonic() < self._refresh_at:
+            return
+
+        with self._auth_lock:
+            if time.monotonic() >= self._refresh_at:
+                self.authenticate(self.client_id, self.client_secret, self.expires)
+
+    def _refresh_token(self, token: str) -> None:
+        # Only the first thread to get the rejected token authenticates again
+        with self._auth_lock:
+            if self.token == token:
+                self.authenticate(self.client_id, self.client_secret, self.expires)
+
+    def _upload(self, upload, url: str, file) -> None:
+        upload(url, file, self._upload_session)
+
+    def _upload_files(self, upload, uploads: list[tuple]) -> None:
+        # On a worker, waiting for other workers could deadlock the executor
+        if len(uploads) == 1 or getattr(self._local, "worker", False):
+            for url, file in uploads:
+                self._upload(upload, url, file)
+            return
+
+        futures = [
+            self._executor.submit(self._upload, upload, url, file)
+            for url, file in uploads
+        ]
+
+        for future in futures:
+            future.result()
+
+    def _cached(self, url: str):
+        entry = self._cache.get(url)
+        if entry is not None and time.monotonic() < entry[0]:
+            # A copy, so the callers changes don't reach the next hits
+            return copy.deepcopy(entry[1])
+
+        return None
+
+    def _cache_result(self, url: str, res: dict) -> None:
+        # Only finished jobs and batches are cached, the others may still change
+        if not self.cache_ttl or not _is_finished(res):
+            return
+
+        res = copy.deepcopy(res)
+
+        with self._cache_lock:
+            if len(self._cache) >= CACHE_MAXSIZE:
+                now = time.monotonic()
+                self._cache = {k: v for k, v in self._cache.items() if v[0] > now}
+
+                if len(self._cache) >= CACHE_MAXSIZE:
+                    del self._cache[next(iter(self._cache))]
+
+            self._cache[url] = (time.monotonic() + self.cache_ttl, res)
+
+    def _get_status(self, url: str):
+        res = self._cached(url)
+        if res is not None:
+            return res
+
+        resp = self._get(url)
+        validate_status_code(resp.status_code, HTTP_OK, resp.content)
+
+        res = decode_json(resp.content)
+        self._cache_result(url, res)
+
+        return res
+
+    def _wait_for_status(self, url: str):
+        res = self._cached(url)
+        if res is not None:
+            return res
+
+        pooling = _Pooling(self, url)
+        error = None
+        deadline = time.monotonic() + self.timeout
+
+        while True:
+            try:
+                # The pooling retries on its own, within the timeout
+                resp = self._get(url, headers=pooling.headers, retry=False)
+            except (requests.exceptions.SSLError, requests.exceptions.ProxyError):
+                # Won't be solved by pooling again
+                raise
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                resp = None
+                error = exc
+
+            wait = pooling.step(resp)
+            if wait is None:
+                return pooling.res
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutException(self.timeout, pooling.res) from error
+
+            time.sleep(min(wait, remaining))
 
     def _get_batch_result(self, batch_id: str, params: dict = None):
-        url = f"{self.base_url}/ocr/batch/result/{batch_id}"
+        url = f"{self._batch_result_url}{batch_id}"
 
         resp = self._get(url, params=params)
-        validate_status_code(resp.status_code, HTTPStatus.OK)
+        validate_status_code(resp.status_code, HTTP_OK, resp.content)
 
-        return resp.json()
+        return decode_json(resp.content)
 
     def authenticate(
         self, client_id: str, client_secret: str, expires: int = DEFAULT_EXPIRATION_TIME
     ) -> None:
         """Authenticate on UltraOCR.
 
-        Authenticate on UltraOCR and save the token to use on future requests.
+        Authenticate on UltraOCR and save the token to use on future requests. The token is
+        reused until it's about to expire, based on its "exp" claim when available.
 
         Args:
             client_id: The Client ID generated on Web Interface.
@@ -146,18 +616,26 @@ class Client:
         Raises:
             InvalidStatusCodeException: If status code is not 200.
         """
-        url = f"{self.auth_base_url}/token"
+        url = self._token_url
         data = {
             "ClientID": client_id,
             "ClientSecret": client_secret,
             "ExpiresIn": expires,
         }
 
-        resp = requests.post(url, json=data, timeout=API_TIMEOUT)
-        validate_status_code(resp.status_code, HTTPStatus.OK)
+        resp = self._request(
+            "POST",
+            url,
+            data=encode_json(data),
+            headers=TOKEN_HEADERS,
+            timeout=API_TIMEOUT,
+        )
+        validate_status_code(resp.status_code, HTTP_OK, resp.content)
 
-        self.token = resp.json()["token"]
-        self.expires_at = datetime.now() + timedelta(minutes=expires)
+        self.token = decode_json(resp.content)["token"]
+        self.expires_at = get_token_expiration(self.token) or (
+            datetime.now() + timedelta(minutes=expires)
+        )
 
     def generate_signed_url(
         self,
@@ -194,12 +672,12 @@ class Client:
         Raises:
             InvalidStatusCodeException: If status code is not 200.
         """
-        url = f"{self.base_url}/ocr/{resource.value}/{service}"
+        url = f"{self._ocr_url}{resource}/{service}"
 
         resp = self._post(url, json=metadata, params=params)
-        validate_status_code(resp.status_code, HTTPStatus.OK)
+        validate_status_code(resp.status_code, HTTP_OK, resp.content)
 
-        return resp.json()
+        return decode_json(resp.content)
 
     def send_job_single_step(
         self,
@@ -237,22 +715,24 @@ class Client:
         if metadata is None:
             metadata = {}
 
-        url = f"{self.base_url}/ocr/job/send/{service}"
+        url = f"{self._job_send_url}{service}"
         body = {
             "metadata": metadata,
             "data": file,
         }
 
-        if params and params.get(KEY_FACEMATCH) == FLAG_TRUE:
-            body.update(KEY_FACEMATCH, facematch_file)
+        flags = params or {}
+
+        if flags.get(KEY_FACEMATCH) == FLAG_TRUE:
+            body[KEY_FACEMATCH] = facematch_file
 
-        if params and params.get(KEY_EXTRA) == FLAG_TRUE:
-            body.update("extra", extra_file)
+        if flags.get(KEY_EXTRA) == FLAG_TRUE:
+            body["extra"] = extra_file
 
         resp = self._post(url, json=body, params=params)
-        validate_status_code(resp.status_code, HTTPStatus.OK)
+        validate_status_code(resp.status_code, HTTP_OK, resp.content)
 
-        return resp.json()
+        return decode_json(resp.content)
 
     def send_job(
         self,
@@ -265,7 +745,8 @@ class Client:
     ):
         """Send job.
 
-        Create and upload a job.
+        Create and upload a job, uploading the facematch and extra files concurrently. With
+        single_step, files up to 4MB are sent with send_job_single_step instead.
 
         Args:
             service: The the type of document to be sent.
@@ -286,26 +767,90 @@ class Client:
         Raises:
             InvalidStatusCodeException: If status code is not 200.
         """
+        flags = params or {}
+        facematch = flags.get(KEY_FACEMATCH) == FLAG_TRUE
+        extra = flags.get(KEY_EXTRA) == FLAG_TRUE
+
+        paths = [
+            file_path,
+            facematch_file_path if facematch else "",
+            extra_file_path if extra else "",
+        ]
+
+        # Small files fit the single step body limit, saving the signed url request
+        if self.single_step and sum(map(_file_size, paths)) <= SINGLE_STEP_MAX_SIZE:
+            return self.send_job_single_step(
+                service, *map(_encode_file, paths), metadata, params
+            )
+
         res = self.generate_signed_url(service, metadata, params, Resource.JOB)
-        urls = res.get("urls", {})
+        urls = res.get("urls") or {}
         job_data = {
             "id": res.get("id"),
             "status_url": res.get("status_url"),
         }
 
-        url = urls.get("document")
-        upload_file_with_path(url, file_path)
+        uploads = [(urls.get("document"), file_path)]
+
+        if facematch:
+            uploads.append((urls.get("selfie"), facematch_file_path))
 
-        if params and params.get(KEY_FACEMATCH) == FLAG_TRUE:
-            facematch_url = urls.get("selfie")
-            upload_file_with_path(facematch_url, facematch_file_path)
+        if extra:
+            uploads.append((urls.get("extra_document"), extra_file_path))
 
-        if params and params.get(KEY_EXTRA) == FLAG_TRUE:
-            extra_url = urls.get("extra_document")
-            upload_file_with_path(extra_url, extra_file_path)
+        self._upload_files(upload_file_with_path, uploads)
 
         return job_data
 
+    def send_jobs_bulk(
+        self,
+        service: str,
+        file_paths: list[str],
+        metadata: dict = None,
+        params: dict = None,
+        facematch_file_paths: list[str] = None,
+        extra_file_paths: list[str] = None,
+    ) -> list[dict]:
+        """Send many jobs.
+
+        Create and upload a job for each file concurrently, with the same service, metadata and
+        query parameters, up to max_concurrency at once. The files of each job are uploaded
+        one after another.
+
+        Args:
+            service: The the type of document to be sent.
+            file_paths: The file paths of the documents, one job each.
+            metadata: The metadata based on UltraOCR Docs format, optional in most cases.
+            params: The query parameters based on UltraOCR Docs, optional in most cases.
+            facematch_file_paths: The facematch file paths, one for each document (only if facematch is requested on params).
+            extra_file_paths: The extra file paths, one for each document (only if extra-document is requested on params).
+
+        Returns:
+            A list with the json response of each job, on the file paths order. For example:
+
+            [
+                {
+                    "id": "0ujsszwN8NRY24YaXiTIE2VWDTS",
+                    "status_url": "https://ultraocr.apis.nuveo.ai/v2/ocr/job/result/0ujsszwN8NRY24YaXiTIE2VWDTS"
+                }
+            ]
+
+        Raises:
+            InvalidStatusCodeException: If status code is not 200.
+            ValueError: If the facematch or extra file paths don't match the documents.
+        """
+        facematch_file_paths = _bulk_paths(
+            file_paths, facematch_file_paths, params, KEY_FACEMATCH
+        )
+        extra_file_paths = _bulk_paths(file_paths, extra_file_paths, params, KEY_EXTRA)
+
+        futures = [
+            self._executor.submit(self.send_job, service, *paths, metadata, params)
+            for paths in zip(file_paths, facematch_file_paths, extra_file_paths)
+        ]
+
+        return [future.result() for future in futures]
+
     def send_batch(
         self, service: str, file_path: str, metadata: list[dict] = None, params: dict = None
     ):
@@ -331,13 +876,13 @@ class Client:
             InvalidStatusCodeException: If status code is not 200.
         """
         res = self.generate_signed_url(service, metadata, params, Resource.BATCH)
-        url = res.get("urls", {}).get("document")
+        url = (res.get("urls") or {}).get("document")
         batch_data = {
             "id": res.get("id"),
             "status_url": res.get("status_url"),
         }
 
-        upload_file_with_path(url, file_path)
+        upload_file_with_path(url, file_path, self._upload_session)
 
         return batch_data
 
@@ -353,7 +898,7 @@ class Client:
         """Send job on base64.
 
         Create and upload a job on base64 format (recommended only if you have already converted
-        the file to base64 format).
+        the file to base64 format), uploading the facematch and extra files concurrently.
 
         Args:
             service: The the type of document to be sent.
@@ -374,31 +919,26 @@ class Client:
         Raises:
             InvalidStatusCodeException: If status code is not 200.
         """
-        if params is None:
-            params = {}
-
-        params = {
-            **params,
-            "base64": FLAG_TRUE,
-        }
+        # Work on a copy, so the caller params are left untouched
+        params = dict(params or ())
+        params["base64"] = FLAG_TRUE
 
         res = self.generate_signed_url(service, metadata, params, Resource.JOB)
-        urls = res.get("urls", {})
+        urls = res.get("urls") or {}
         job_data = {
             "id": res.get("id"),
             "status_url": res.get("status_url"),
         }
 
-        url = urls.get("document")
-        upload_file(url, file)
+        uploads = [(urls.get("document"), file)]
 
-        if params and params.get(KEY_FACEMATCH) == FLAG_TRUE:
-            facematch_url = urls.get("selfie")
-            upload_file(facematch_url, facematch_file)
+        if params.get(KEY_FACEMATCH) == FLAG_TRUE:
+            uploads.append((urls.get("selfie"), facematch_file))
 
-        if params and params.get(KEY_EXTRA) == FLAG_TRUE:
-            extra_url = urls.get("extra_document")
-            upload_file(extra_url, extra_file)
+        if params.get(KEY_EXTRA) == FLAG_TRUE:
+            uploads.append((urls.get("extra_document"), extra_file))
+
+        self._upload_files(upload_file, uploads)
 
         return job_data
 
@@ -431,22 +971,18 @@ class Client:
         Raises:
             InvalidStatusCodeException: If status code is not 200.
         """
-        if params is None:
-            params = {}
-
-        params = {
-            **params,
-            "base64": FLAG_TRUE,
-        }
+        # Work on a copy, so the caller params are left untouched
+        params = dict(params or ())
+        params["base64"] = FLAG_TRUE
 
         res = self.generate_signed_url(service, metadata, params, Resource.BATCH)
-        url = res.get("urls", {}).get("document")
+        url = (res.get("urls") or {}).get("document")
         batch_data = {
             "id": res.get("id"),
             "status_url": res.get("status_url"),
         }
 
-        upload_file(url, file)
+        upload_file(url, file, self._upload_session)
 
         return batch_data
 
@@ -479,12 +1015,9 @@ class Client:
         Raises:
             InvalidStatusCodeException: If status code is not 200.
         """
-        url = f"{self.base_url}/ocr/batch/status/{batch_id}"
+        url = f"{self._batch_status_url}{batch_id}"
 
-        resp = self._get(url)
-        validate_status_code(resp.status_code, HTTPStatus.OK)
-
-        return resp.json()
+        return self._get_status(url)
 
     def get_job_result(self, batch_id: str, job_id: str):
         """Get job result.
@@ -524,17 +1057,15 @@ class Client:
         Raises:
             InvalidStatusCodeException: If status code is not 200.
         """
-        url = f"{self.base_url}/ocr/job/result/{batch_id}/{job_id}"
-
-        resp = self._get(url)
-        validate_status_code(resp.status_code, HTTPStatus.OK)
+        url = f"{self._job_result_url}{batch_id}/{job_id}"
 
-        return resp.json()
+        return self._get_status(url)
 
     def wait_for_job_done(self, batch_id: str, job_id: str):
         """Wait the job to be processed.
 
-        Wait the job to be processed and returns the result.
+        Wait the job to be processed and returns the result. The pooling interval grows
+        exponentially until the job is done or the timeout given on Client creation is reached.
 
         Args:
             batch_id: The id of the batch, given on batch creation(repeat the job_id if batch wasn't created).
@@ -570,28 +1101,16 @@ class Client:
             InvalidStatusCodeException: If status code is not 200.
             TimeoutException: If wait time exceed the limit.
         """
-        timeout_start = time.time()
-        res = None
-
-        while time.time() < timeout_start + self.timeout:
-            res = self.get_job_result(batch_id, job_id)
+        url = f"{self._job_result_url}{batch_id}/{job_id}"
 
-            status = res["status"]
-            if status in [STATUS_DONE, STATUS_ERROR]:
-                break
-
-            time.sleep(self.interval)
-
-        if time.time() > timeout_start + self.timeout:
-            raise TimeoutException(self.timeout, res)
-
-        return res
+        return self._wait_for_status(url)
 
     def wait_for_batch_done(self, batch_id: str, wait_jobs: bool = True):
         """Wait the batch to be processed.
 
         Wait the batch to be processed and returns the status. The function will wait the timeout
-        given on Client creation.
+        given on Client creation, with the pooling interval growing exponentially. The batch jobs
+        not yet finished on the batch status are waited concurrently.
 
         Args:
             batch_id: The id of the batch, given on batch creation.
@@ -619,25 +1138,22 @@ class Client:
             InvalidStatusCodeException: If status code is not 200.
             TimeoutException: If wait time exceed the limit.
         """
-        timeout_start = time.time()
-        res = None
-
-        while time.time() < timeout_start + self.timeout:
-            res = self.get_batch_status(batch_id)
-
-            status = res["status"]
-            if status in [STATUS_DONE, STATUS_ERROR]:
-                break
-
-            time.sleep(self.interval)
-
-        if time.time() > timeout_start + self.timeout:
-            raise TimeoutException(self.timeout, res)
-
-        if wait_jobs:
-            for job in res["jobs"]:
-                job_id = job["job_ksuid"]
-                self.wait_for_job_done(batch_id, job_id)
+        url = f"{self._batch_status_url}{batch_id}"
+        res = self._wait_for_status(url)
+
+        # Only the jobs not yet finished on the batch status need to be waited
+        jobs = [
+            job
+            for job in res.get("jobs") or []
+            if job.get("status") not in FINAL_STATUSES
+        ]
+        if wait_jobs and jobs:
+            list(
+                self._executor.map(
+                    lambda job: self.wait_for_job_done(batch_id, job["job_ksuid"]),
+                    jobs,
+                )
+            )
 
         return res
 
@@ -664,24 +1180,24 @@ class Client:
 
         Raises:
             InvalidStatusCodeException: If status code is not 200.
-            TimeoutException: If wait time exceed the limit.
         """
-        url = f"{self.base_url}/ocr/job/results"
+        url = self._job_results_url
         params = {
             "startDate": start,
-            "endtDate": end,
+            "endDate": end,
         }
 
         jobs = []
         has_next_page = True
         while has_next_page:
             resp = self._get(url, params=params)
-            res = resp.json()
+            validate_status_code(resp.status_code, HTTP_OK, resp.content)
+            res = decode_json(resp.content)
 
-            jobs += res.get("jobs")
+            jobs.extend(res.get("jobs") or [])
             token = res.get("nextPageToken")
 
-            params.update("nextPageToken", token)
+            params["nextPageToken"] = token
 
             if not token:
                 has_next_page = False
@@ -746,6 +1262,7 @@ class Client:
 
         job_id = res.get("id")
 
+        # A job sent without a batch is its own batch, so the job id is repeated
         return self.wait_for_job_done(job_id, job_id)
 
     def create_and_wait_batch(
@@ -838,12 +1355,9 @@ class Client:
         Raises:
             InvalidStatusCodeException: If status code is not 200.
         """
-        url = f"{self.base_url}/ocr/job/info/{job_id}"
-
-        resp = self._get(url)
-        validate_status_code(resp.status_code, HTTPStatus.OK)
+        url = f"{self._job_info_url}{job_id}"
 
-        return resp.json()
+        return self._get_status(url)
     
     def get_batch_info(self, batch_id: str):
         """Get document batch info.
@@ -872,12 +1386,9 @@ class Client:
         Raises:
             InvalidStatusCodeException: If status code is not 200.
         """
-        url = f"{self.base_url}/ocr/batch/info/{batch_id}"
-
-        resp = self._get(url)
-        validate_status_code(resp.status_code, HTTPStatus.OK)
+        url = f"{self._batch_info_url}{batch_id}"
 
-        return resp.json()
+        return self._get_status(url)
     
     def get_batch_result(self, batch_id: str):
         """Get batch jobs results.
@@ -944,12 +1455,8 @@ class Client:
         Raises:
             InvalidStatusCodeException: If status code is not 200.
         """
-        if params is None:
-            params = {}
-
-        params = {
-            **params,
-            "return": RETURN_STORAGE,
-        }
+        # Work on a copy, so the caller params are left untouched
+        params = dict(params or ())
+        params["return"] = RETURN_STORAGE
 
         return self._get_batch_result(batch_id, params)
\ No newline at end of file
@@ -1,12 +1,29 @@
 """ Module providing some functions to help """
 
-from http import HTTPStatus
+import json
+import math
+import time
+import base64
+import threading
+from datetime import datetime
 
 import requests
 
-from ultraocr.constants import UPLOAD_TIMEOUT
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ultraocr.constants import UPLOAD_TIMEOUT, UPLOAD_STATUS_CODES
 from ultraocr.exceptions import InvalidStatusCodeException
 
+# Signed urls must not receive the session Authorization header
+NO_AUTH_HEADERS = {"Authorization": None}
+JSON_HEADERS = {"Content-Type": "application/json"}
+GZIP_JSON_HEADERS = {**JSON_HEADERS, "Content-Encoding": "gzip"}
+# The token request authenticates with the client credentials, not the old token
+TOKEN_HEADERS = {**JSON_HEADERS, **NO_AUTH_HEADERS}
+
 
 class BearerAuth(requests.auth.AuthBase):
     """Helper for add bearer authentication in requests"""
@@ -19,52 +36,178 @@ class BearerAuth(requests.auth.AuthBase):
         return r
 
 
-def upload_file(url: str, file: str):
+def upload_file(url: str, file: str, session: requests.Session = None):
     """Upload file.
 
-    Upload file given the content.
+    Upload file given the content. Text content is encoded once before the request, so it's
+    sent without extra copies.
 
     Args:
         url: The url to upload the file.
-        file: The file content.
+        file: The file content, as text or bytes.
+        session: The session used to upload, reusing its connections (Default new connection).
 
     Returns:
         The request output.
     """
-    resp = requests.put(url, data=file, timeout=UPLOAD_TIMEOUT)
-    validate_status_code(resp.status_code, HTTPStatus.OK)
+    if isinstance(file, str):
+        file = file.encode()
+
+    resp = (session or requests).put(
+        url, data=file, headers=NO_AUTH_HEADERS, timeout=UPLOAD_TIMEOUT
+    )
+    validate_status_code(resp.status_code, UPLOAD_STATUS_CODES, resp.content)
 
 
-def upload_file_with_path(url: str, file_path: str):
+def upload_file_with_path(url: str, file_path: str, session: requests.Session = None):
     """Upload file given a file path.
 
-    Open and upload file given a file path.
+    Open and upload file given a file path, streaming its content instead of reading it
+    into memory.
 
     Args:
         url: The url to upload the file.
         file_path: The file path.
+        session: The session used to upload, reusing its connections (Default new connection).
 
     Returns:
         The request output.
     """
     with open(file_path, "rb") as file_bin:
-        data = file_bin.read()
+        resp = (session or requests).put(
+            url, data=file_bin, headers=NO_AUTH_HEADERS, timeout=UPLOAD_TIMEOUT
+        )
+
+    validate_status_code(resp.status_code, UPLOAD_STATUS_CODES, resp.content)
+
+
+class RateLimiter:
+    """Helper for limit the requests rate"""
+
+    def __init__(self, rps: float = 0):
+        self.min_interval = 1 / rps if rps else 0
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Wait until the next request is allowed."""
+        if not self.min_interval:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.min_interval
+
+        if wait > 0:
+            time.sleep(wait)
+
+
+def decode_json(content: bytes):
+    """Decode JSON.
+
+    Decode a JSON content, using orjson when it's installed.
+
+    Args:
+        content: The JSON content, as bytes.
+
+    Returns:
+        The decoded content.
+    """
+    if orjson:
+        return orjson.loads(content)
+
+    return json.loads(content)
+
+
+def _check_finite(data) -> None:
+    # orjson writes NaN and Infinity as null, the json module raises like requests does
+    if isinstance(data, float):
+        if not math.isfinite(data):
+            raise ValueError("Out of range float values are not JSON compliant")
+    elif isinstance(data, dict):
+        for value in data.values():
+            _check_finite(value)
+    elif isinstance(data, (list, tuple)):
+        for value in data:
+            _check_finite(value)
+
+
+def encode_json(data) -> bytes:
+    """Encode JSON.
+
+    Encode a JSON content, using orjson when it's installed. Non string keys are converted
+    to strings, like the json module does.
 
-    resp = requests.put(url, data=data, timeout=UPLOAD_TIMEOUT)
-    validate_status_code(resp.status_code, HTTPStatus.OK)
+    Args:
+        data: The content to encode.
+
+    Returns:
+        The encoded content, as bytes.
+
+    Raises:
+        ValueError: If the content has NaN or Infinity values.
+    """
+    if orjson:
+        _check_finite(data)
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+    return json.dumps(data, allow_nan=False).encode()
+
+
+def get_token_expiration(token: str):
+    """Get token expiration.
+
+    Get the expiration datetime from the token "exp" claim, without verifying the token.
+
+    Args:
+        token: The authentication token.
+
+    Returns:
+        The token expiration datetime, or None if the token isn't a JWT with "exp" claim.
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = decode_json(base64.urlsafe_b64decode(payload))
+        return datetime.fromtimestamp(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError, OverflowError, OSError):
+        return None
+
+
+def get_retry_after(resp: requests.Response, default: float) -> float:
+    """Get retry after.
+
+    Get the time to wait before retrying from the response "Retry-After" header.
+
+    Args:
+        resp: The response.
+        default: The time to wait if the header isn't given in seconds.
+
+    Returns:
+        The time to wait in seconds.
+    """
+    try:
+        return max(float(resp.headers["Retry-After"]), 0)
+    except (KeyError, TypeError, ValueError):
+        return default
 
 
-def validate_status_code(status: int, want: int):
+def validate_status_code(status: int, want, body: bytes = b""):
     """Validate status code.
 
     Validate status code and raise excepction if invalid.
 
     Args:
         status: The response status code.
-        want: The expected status code.
+        want: The expected status code, or a collection of accepted status codes.
+        body: The response body, added to the exception to explain the error (Default empty).
 
     Raises:
         InvalidStatusCodeException: If status isn't valid.
     """
-    if status != want:
-        raise InvalidStatusCodeException(status, want)
+    if status == want:
+        return
+
+    if isinstance(want, int) or status not in want:
+        raise InvalidStatusCodeException(status, want, body)